@@ -3,15 +3,32 @@
 
 from __future__ import annotations
 
+import functools
+import logging
+import multiprocessing
 import re
-from typing import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator
 
 import bibtexparser
-from bibtexparser.bwriter import BibTexWriter
-from bibtexparser.bibdatabase import BibDatabase
+from iso4 import abbreviate as iso4_abbreviate
 from pylatexenc.latexencode import unicode_to_latex
 from titlecase import titlecase
 
+# bibtexparser >= 2.0 replaced loads() with the faster parse_string().
+BIBTEXPARSER_V2 = hasattr(bibtexparser, "parse_string")
+if BIBTEXPARSER_V2:
+    from bibtexparser import Library
+    from bibtexparser.middlewares import RemoveEnclosingMiddleware
+    from bibtexparser.model import (
+        DuplicateBlockKeyBlock,
+        DuplicateFieldKeyBlock,
+        Entry,
+        ParsingFailedBlock,
+    )
+
+logger = logging.getLogger(__name__)
+
 
 TYPE_SPECS = {
     "article": {
@@ -75,6 +92,18 @@ TYPE_SPECS = {
     },
 }
 
+for _spec in TYPE_SPECS.values():
+    _spec["all_fields"] = frozenset(_spec["required_fields"] | _spec["optional_fields"])
+del _spec
+
+# Parsed (or detected) entry type -> spec.
+_ETYPE_DISPATCH = {
+    "article": TYPE_SPECS["article"],
+    "book": TYPE_SPECS["book"],
+    "incollection": TYPE_SPECS["chapter"],
+    "pre-print": TYPE_SPECS["pre-print"],
+}
+
 PROTECT_TITLE_TOKENS = [
     "PROTAC", "PROTACs",
     "BRD4", "BET", "CRBN",
@@ -85,9 +114,67 @@ PROTECT_TITLE_TOKENS = [
 
 JOURNAL_ABBREV: dict[str, str] = {}
 
-PAGE_DASH_RE = re.compile(r"\s*(?:–|—|-)\s*")
+# Bibliographies with more entries than this are normalized in a process
+# pool. Off (None) by default: with the caches above, normalizing costs tens
+# of microseconds per entry and parsing dominates, so the pool has not been
+# shown to pay for its start-up and pickling. Set it to opt in on many-core
+# hosts.
+PARALLEL_THRESHOLD: int | None = None
+
+# Formatted entries per chunk yielded by clean_bibtex_text_iter.
+STREAM_BATCH_SIZE = 256
+
+# Use the built-in title-caser; set to False to fall back to the titlecase
+# package for titles it gets wrong.
+FAST_TITLECASE = True
+
+TITLECASE_SMALL_WORDS = frozenset({
+    "a", "an", "and", "as", "at", "but", "by", "en", "for", "if", "in",
+    "nor", "of", "on", "or", "per", "the", "to", "v", "vs", "via",
+})
+
+PAGE_DASH_TR = str.maketrans({"–": "--", "—": "--", "-": "--"})
+PAGE_SEP_RE = re.compile(r"\s*--\s*")
+_PAGE_CHARS_TR = str.maketrans("", "", "0123456789-")
 BRACED_GROUP_RE = re.compile(r"\{[^{}]*\}")
-MATH_GROUP_RE = re.compile(r"\$(?:\\.|[^$])*\$")
+MATH_GROUP_RE = re.compile(r"(\$(?:\\.|[^$])*\$)")
+_WHITESPACE_SPLIT_RE = re.compile(r"(\s+)")
+_COMPOUND_SPLIT_RE = re.compile(r"([-/])")
+# An accent macro as produced by latexify (\'e, \"u, \r{a}, ...); the
+# letter after it is the word's first letter.
+_ACCENT_PREFIX_RE = re.compile(r"\\(?:[`'^\"~=.]|[a-zA-Z](?![a-zA-Z]))\{?")
+_INLINE_PERIOD_RE = re.compile(r"\w\.\w")
+_APOS_SECOND_RE = re.compile(r"[dol]'[a-z]+", re.IGNORECASE)
+_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+_NONALNUM_RE = re.compile(r"[^A-Za-z0-9]+")
+_NONDIGIT_RE = re.compile(r"[^0-9]+")
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_tokens(tokens: tuple[str, ...]) -> re.Pattern:
+    # Callers pass tuple(sorted(set(tokens))), so equal token lists share a
+    # cache slot whatever their order, and edits to PROTECT_TITLE_TOKENS at
+    # runtime are picked up on the next call. Braced groups are matched
+    # first so the callback can pass them through untouched; tokens go
+    # longest first so "PROTACs" wins over "PROTAC".
+    ordered = sorted(tokens, key=len, reverse=True)
+    if not ordered:
+        return BRACED_GROUP_RE
+    alternation = "|".join(re.escape(tok) for tok in ordered)
+    return re.compile(
+        rf"{BRACED_GROUP_RE.pattern}|(?<!\w)(?:{alternation})(?!\w)"
+    )
+
+
+def _protect_match(m: re.Match) -> str:
+    tok = m.group(0)
+    if tok.startswith("{"):
+        return tok
+    return f"{{{tok}}}"
+
+
+# Compile the default token pattern at import.
+_compile_tokens(tuple(sorted(set(PROTECT_TITLE_TOKENS))))
 
 
 def normalize_pages(pages: str) -> str:
@@ -95,59 +182,130 @@ def normalize_pages(pages: str) -> str:
         return pages
     pages = pages.strip()
     if "--" in pages:
-        return re.sub(r"\s*--\s*", "--", pages)
-    parts = PAGE_DASH_RE.split(pages)
-    if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
-        return f"{parts[0]}--{parts[1]}"
-    return PAGE_DASH_RE.sub("--", pages)
+        # Already "NNN--NNN" (digits and ASCII dashes only): nothing to fix.
+        if not pages.translate(_PAGE_CHARS_TR):
+            return pages
+        return PAGE_SEP_RE.sub("--", pages)
+    pages = pages.translate(PAGE_DASH_TR)
+    if len(pages.split()) == 1:
+        return pages
+    return PAGE_SEP_RE.sub("--", pages)
+
+
+@functools.lru_cache(maxsize=8192)
+def _latexify_cached(s: str) -> str:
+    return unicode_to_latex(s, non_ascii_only=True)
 
 
 def latexify(s: str) -> str:
-    if not s:
+    # non_ascii_only=True leaves pure-ASCII input untouched anyway.
+    if not s or s.isascii():
         return s
-    return unicode_to_latex(s, non_ascii_only=True)
+    return _latexify_cached(s)
 
 
-def protect_tokens_in_title(raw_title: str, tokens: Iterable[str]) -> str:
+def protect_tokens_in_title(
+    raw_title: str, tokens: Iterable[str] = PROTECT_TITLE_TOKENS
+) -> str:
     if not raw_title:
         return raw_title
 
-    braced: list[str] = []
+    pattern = _compile_tokens(tuple(sorted(set(tokens))))
+    return pattern.sub(_protect_match, raw_title)
 
-    def _stash(m):
-        braced.append(m.group(0))
-        return f"@@BRACED{len(braced) - 1}@@"
 
-    tmp = BRACED_GROUP_RE.sub(_stash, raw_title)
-
-    for tok in sorted(set(tokens), key=len, reverse=True):
-        pattern = re.compile(rf"(?<!\w)({re.escape(tok)})(?!\w)")
-        tmp = pattern.sub(r"{\1}", tmp)
+def _capitalize_word(word: str) -> str:
+    for i, ch in enumerate(word):
+        if ch.isalnum() or ch == "\\":
+            break
+    else:
+        return word
+    if ch == "\\":
+        m = _ACCENT_PREFIX_RE.match(word, i)
+        if not m or m.end() == len(word):
+            return word  # some other command, e.g. \textit{...}
+        i = m.end()
+        ch = word[i]
+    # Acronyms and mixed-case words (DNA, iPhone, McDonald) are left alone.
+    if not ch.islower() or any(c.isupper() for c in word[i + 1:]):
+        return word
+    return word[:i] + ch.upper() + word[i + 1:]
+
+
+def _titlecase_word(word: str, capitalize_small: bool) -> str:
+    # URLs, domains and abbreviations like e.g. are kept as written.
+    if _INLINE_PERIOD_RE.search(word):
+        return word
+    if _APOS_SECOND_RE.fullmatch(word):
+        return word[0].upper() + word[1] + word[2].upper() + word[3:]
+
+    # Compounds are title-cased piece by piece: first-in-Class, and/or.
+    pieces = [word] if "//" in word else _COMPOUND_SPLIT_RE.split(word)
+    for j in range(0, len(pieces), 2):
+        piece = pieces[j]
+        bare = piece.strip("()[]\"'.,;:!?").lower()
+        if bare in TITLECASE_SMALL_WORDS and not (j == 0 and capitalize_small):
+            pieces[j] = piece.lower()
+        else:
+            pieces[j] = _capitalize_word(piece)
+    return "".join(pieces)
 
-    for i, grp in enumerate(braced):
-        tmp = tmp.replace(f"@@BRACED{i}@@", grp)
 
-    return tmp
+def _fast_titlecase(
+    s: str,
+    at_start: bool = True,
+    at_end: bool = True,
+    all_caps: bool | None = None,
+) -> str:
+    # at_start/at_end say whether s begins/ends the whole title, so text
+    # between math groups keeps its small words lowercase. An all-caps title
+    # is lowercased word by word first, like the titlecase package does.
+    if all_caps is None:
+        all_caps = s.upper() == s
+    # Words sit at even indices, the whitespace between them at odd ones.
+    parts = _WHITESPACE_SPLIT_RE.split(s)
+    last = -1
+    if at_end:
+        last = max((i for i in range(0, len(parts), 2) if parts[i]), default=-1)
+    depth = 0
+    capitalize_next = at_start
+    for i in range(0, len(parts), 2):
+        word = parts[i]
+        if not word:
+            continue
+        if depth == 0 and word[0] not in "{$":
+            if all_caps and not _INLINE_PERIOD_RE.search(word):
+                word = word.lower()
+            word = _titlecase_word(word, capitalize_next or i == last)
+            parts[i] = word
+        depth = max(depth + word.count("{") - word.count("}"), 0)
+        capitalize_next = word.endswith((":", "?", "!"))
+    return "".join(parts)
 
 
 def smart_titlecase(title: str) -> str:
     if not title:
         return title
-    
-    math: list[str] = []
-
-    def _stash_math(m):
-        math.append(m.group(0))
-        return f"ZZMATH{len(math) - 1}ZZ"
 
-    tmp = MATH_GROUP_RE.sub(_stash_math, title)
-    tmp = protect_tokens_in_title(tmp, PROTECT_TITLE_TOKENS)
-    tmp = titlecase(tmp)
+    # Captured math groups land at odd indices and are kept verbatim.
+    chunks = MATH_GROUP_RE.split(title)
+    last = len(chunks) - 1
+    text = "".join(chunks[0::2])
+    all_caps = text.upper() == text
+    for i in range(0, len(chunks), 2):
+        if not chunks[i]:
+            continue
+        tmp = protect_tokens_in_title(chunks[i], PROTECT_TITLE_TOKENS)
+        if FAST_TITLECASE:
+            tmp = _fast_titlecase(
+                tmp, at_start=i == 0, at_end=i == last, all_caps=all_caps
+            )
+        else:
+            tmp = titlecase(tmp)
+        chunks[i] = tmp
 
-    for i, grp in enumerate(math):
-        tmp = tmp.replace(f"ZZMATH{i}ZZ", grp)
+    return "".join(chunks)
 
-    return tmp
 
 def protecting_titlecase(title: str) -> str:
     def protect_word(word):
@@ -159,6 +317,23 @@ def protecting_titlecase(title: str) -> str:
             return word
     return ' '.join(protect_word(word) if word[1:-1] not in PROTECT_TITLE_TOKENS else word for word in title.split())
 
+
+# Only successful lookups are cached: lru_cache does not store exceptions, so
+# a transient failure is retried on the next call.
+@functools.lru_cache(maxsize=4096)
+def _iso4_abbreviate(journal: str) -> str:
+    try:
+        abbrev = iso4_abbreviate(journal)
+    except LookupError:
+        import nltk
+        nltk.download("wordnet", quiet=True)
+        nltk.download("omw-1.4", quiet=True)
+        abbrev = iso4_abbreviate(journal)
+    if 'AC ' in abbrev:
+        abbrev = abbrev.replace('AC ', 'ACS ')
+    return abbrev
+
+
 def abbreviate_journal(journal: str, journal_abbrev: dict[str, str] | None = None) -> str:
     if not journal:
         return journal
@@ -168,17 +343,7 @@ def abbreviate_journal(journal: str, journal_abbrev: dict[str, str] | None = Non
         return overrides[journal]
 
     try:
-        from iso4 import abbreviate as iso4_abbreviate
-        journal_abbrev = iso4_abbreviate(journal)
-        if 'AC ' in journal_abbrev:
-            journal_abbrev = journal_abbrev.replace('AC ', 'ACS ')
-        return journal_abbrev
-    except LookupError:
-        import nltk
-        nltk.download("wordnet", quiet=True)
-        nltk.download("omw-1.4", quiet=True)
-        from iso4 import abbreviate as iso4_abbreviate
-        return iso4_abbreviate(journal)
+        return _iso4_abbreviate(journal)
     except Exception:
         return journal
 
@@ -198,11 +363,11 @@ def make_key(entry: dict) -> str:
     else:
         last = first.split()[-1].strip() if first else "unknown"
 
-    words = re.findall(r"[A-Za-z0-9]+", title)
+    words = _WORD_RE.findall(title)
     short = "".join(w.capitalize() for w in words[:4]) or "untitled"
 
-    last = re.sub(r"[^A-Za-z0-9]+", "", last.lower()) or "unknown"
-    year = re.sub(r"[^0-9]+", "", year) or "nd"
+    last = _NONALNUM_RE.sub("", last.lower()) or "unknown"
+    year = _NONDIGIT_RE.sub("", year) or "nd"
 
     return f"{last}{year}_{short}"
 
@@ -215,6 +380,7 @@ def normalize_entry(
     journal_abbrev: dict[str, str] | None = None,
 ) -> dict:
     etype = entry.get("ENTRYTYPE", "").lower()
+    notes: list[str] = []
 
     if etype == "misc":
         doi = str(entry.get("doi", "")).lower()
@@ -223,17 +389,10 @@ def normalize_entry(
             entry = dict(entry)
             entry["ENTRYTYPE"] = "article"
             entry["journal"] = "{{arXiv}}"
-            entry["note"] = (entry.get("note", "") + " arxiv detected in DOI").strip()
-
-    if etype == "article":
-        spec = TYPE_SPECS["article"]
-    elif etype == "book":
-        spec = TYPE_SPECS["book"]
-    elif etype == "incollection":
-        spec = TYPE_SPECS["chapter"]
-    elif etype == "pre-print":
-        spec = TYPE_SPECS["pre-print"]
-    else:
+            notes.append("arxiv detected in DOI")
+
+    spec = _ETYPE_DISPATCH.get(etype)
+    if spec is None:
         entry["note"] = (entry.get("note", "") + " Could not detect document type").strip()
         return entry
 
@@ -242,9 +401,12 @@ def normalize_entry(
         "ID": entry.get("ID", ""),
     }
 
-    for k in spec["required_fields"].union(spec["optional_fields"]):
-        if k in entry and str(entry[k]).strip():
-            out[k] = str(entry[k]).strip()
+    for k in spec["all_fields"]:
+        value = entry.get(k)
+        if value:
+            value = str(value).strip()
+            if value:
+                out[k] = value
 
     if "author" in out:
         out["author"] = latexify(out["author"])
@@ -272,9 +434,17 @@ def normalize_entry(
             out["year"] = year_match.group(0)
             out.pop("date")
 
-    missing = [r for r in spec["required_fields"] if r not in out or not out[r].strip()]
+    # Sorted: set order depends on the per-process hash seed, which differs
+    # between pool workers.
+    missing = [
+        r for r in sorted(spec["required_fields"])
+        if r not in out or not out[r].strip()
+    ]
     if missing:
-        out["note"] = (out.get("note", "") + " " + f"[MISSING: {', '.join(missing)}]").strip()
+        notes.append(f"[MISSING: {', '.join(missing)}]")
+
+    if notes:
+        out["note"] = " ".join([out.get("note", ""), *notes]).strip()
 
     if regen_keys:
         out["ID"] = make_key(out)
@@ -282,28 +452,175 @@ def normalize_entry(
     return out
 
 
-def clean_bibtex_text(
+def _recover_entry(block: ParsingFailedBlock, library: Library) -> Entry | None:
+    # bibtexparser 1.x kept entries with a repeated key or a repeated field;
+    # 2.x sets them aside without running the parse middlewares, so resolve
+    # @string references and strip enclosing braces/quotes here.
+    entry = block.ignore_error_block
+    recoverable = isinstance(block, (DuplicateBlockKeyBlock, DuplicateFieldKeyBlock))
+    if not recoverable or not isinstance(entry, Entry):
+        # Like 1.x, skip the malformed block and keep the rest of the file.
+        raw = (block.raw or "").strip().splitlines()
+        logger.warning(
+            "Skipping unparsable BibTeX block %r: %r",
+            raw[0][:80] if raw else "",
+            block.error,
+        )
+        return None
+
+    strings = library.strings_dict
+    references = {
+        i: strings[f.value].value
+        for i, f in enumerate(entry.fields)
+        if isinstance(f.value, str) and f.value in strings
+    }
+    entry = RemoveEnclosingMiddleware(True).transform_entry(entry, library)
+    for i, value in references.items():
+        entry.fields[i].value = value
+    return entry
+
+
+def _parse_entries(text: str) -> list[dict]:
+    """Parse BibTeX into bibtexparser 1.x style entry dicts."""
+    if not BIBTEXPARSER_V2:
+        return bibtexparser.loads(text).entries
+
+    library = bibtexparser.parse_string(text)
+    entries = []
+    for block in library.blocks:
+        if isinstance(block, ParsingFailedBlock):
+            block = _recover_entry(block, library)
+            if block is None:
+                continue
+        elif not isinstance(block, Entry):
+            continue  # @string, @preamble and comments
+        # If a field is repeated, the last value wins.
+        entry = {f.key.lower(): f.value for f in block.fields}
+        entry["ENTRYTYPE"] = block.entry_type.lower()
+        entry["ID"] = block.key
+        entries.append(entry)
+    return entries
+
+
+def _format_entry(entry: dict) -> str:
+    # Same layout as bibtexparser 1.x's BibTexWriter with a tab indent:
+    # fields sorted by name, no trailing comma. Entries are separated by a
+    # blank line, which the caller adds between them.
+    fields = "".join(
+        f",\n\t{k} = {{{entry[k]}}}"
+        for k in sorted(entry)
+        if k not in ("ENTRYTYPE", "ID")
+    )
+    return f"@{entry['ENTRYTYPE']}{{{entry['ID']}{fields}\n}}\n"
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    # Never fork: the Django dev server is threaded, and forking a threaded
+    # process can deadlock the child.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload([__name__])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+def _init_worker(settings: dict) -> None:
+    # Workers import this module afresh, so apply the parent's current
+    # module-level settings to keep pool and serial output identical.
+    globals().update(settings)
+
+
+def iter_clean_entries(
     text: str,
     do_titlecase: bool = True,
     protect_titlecase: bool = False,
     regen_keys: bool = False,
     journal_abbrev: dict[str, str] | None = None,
-) -> str:
-    db = bibtexparser.loads(text)
-    new_db = BibDatabase()
+) -> Iterator[dict]:
+    """Yield normalized entries one at a time.
 
-    new_db.entries = [
-        normalize_entry(
-            e,
+    Each parsed entry is dropped as soon as it has been normalized, so the
+    raw and cleaned copies of the bibliography are never held side by side.
+    Inputs above PARALLEL_THRESHOLD are spread over a process pool instead.
+    """
+    normalize = functools.partial(
+        normalize_entry,
+        do_titlecase=do_titlecase,
+        protect_titlecase=protect_titlecase,
+        regen_keys=regen_keys,
+        journal_abbrev=journal_abbrev,
+    )
+    entries = _parse_entries(text)
+
+    if PARALLEL_THRESHOLD is not None and len(entries) > PARALLEL_THRESHOLD:
+        settings = {
+            "PROTECT_TITLE_TOKENS": list(PROTECT_TITLE_TOKENS),
+            "JOURNAL_ABBREV": dict(JOURNAL_ABBREV),
+            "FAST_TITLECASE": FAST_TITLECASE,
+        }
+        with ProcessPoolExecutor(
+            mp_context=_pool_context(),
+            initializer=_init_worker,
+            initargs=(settings,),
+        ) as executor:
+            yield from executor.map(normalize, entries, chunksize=64)
+        return
+
+    entries.reverse()
+    while entries:
+        yield normalize(entries.pop())
+
+
+def _iter_batches(entry_texts: list[str]) -> Iterator[str]:
+    # Entries are separated by a blank line, including across batches.
+    for i in range(0, len(entry_texts), STREAM_BATCH_SIZE):
+        chunk = "\n".join(entry_texts[i:i + STREAM_BATCH_SIZE])
+        yield chunk if i == 0 else "\n" + chunk
+
+
+def clean_bibtex_text_iter(
+    text: str,
+    do_titlecase: bool = True,
+    protect_titlecase: bool = False,
+    regen_keys: bool = False,
+    journal_abbrev: dict[str, str] | None = None,
+) -> Iterator[str]:
+    """Clean ``text`` and return an iterator over chunks of formatted output.
+
+    Entries are sorted by ID, so parsing and normalization happen up front
+    (and raise here); only the output is deferred to iteration, in chunks
+    of STREAM_BATCH_SIZE entries. Each entry
+    is kept as an ``(ID, text)`` pair rather than a field dict while the
+    rest of the bibliography is processed.
+    """
+    formatted = [
+        (e.get("ID", ""), _format_entry(e))
+        for e in iter_clean_entries(
+            text,
             do_titlecase=do_titlecase,
             protect_titlecase=protect_titlecase,
             regen_keys=regen_keys,
             journal_abbrev=journal_abbrev,
         )
-        for e in db.entries
     ]
+    # Case-insensitive, like BibDatabase.entry_sort_key in BibTexWriter.
+    formatted.sort(key=lambda pair: pair[0].lower())
+    return _iter_batches([entry_text for _, entry_text in formatted])
+
 
-    writer = BibTexWriter()
-    writer.indent = "\t"
-    writer.order_entries_by = ("ID",)
-    return writer.write(new_db)
+def clean_bibtex_text(
+    text: str,
+    do_titlecase: bool = True,
+    protect_titlecase: bool = False,
+    regen_keys: bool = False,
+    journal_abbrev: dict[str, str] | None = None,
+) -> str:
+    return "".join(
+        clean_bibtex_text_iter(
+            text,
+            do_titlecase=do_titlecase,
+            protect_titlecase=protect_titlecase,
+            regen_keys=regen_keys,
+            journal_abbrev=journal_abbrev,
+        )
+    )
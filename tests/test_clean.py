@@ -0,0 +1,62 @@
+"""Regression tests for the bibtexparser 2.x parsing path in clean.py."""
+
+import unittest
+
+try:
+    import clean
+except ImportError as exc:  # bibtexparser / pylatexenc / titlecase / iso4
+    raise unittest.SkipTest(f"clean.py dependencies not installed: {exc}")
+
+
+@unittest.skipUnless(clean.BIBTEXPARSER_V2, "requires bibtexparser >= 2.0")
+class ParseEntriesV2Tests(unittest.TestCase):
+    def test_duplicate_key_entries_are_kept(self):
+        text = (
+            "@article{k1,\n  title = {First},\n  year = {2001}\n}\n\n"
+            "@article{k1,\n  title = {Second},\n  year = {2002}\n}\n"
+        )
+        entries = clean._parse_entries(text)
+        self.assertEqual(
+            [(e["ID"], e["title"], e["year"]) for e in entries],
+            [("k1", "First", "2001"), ("k1", "Second", "2002")],
+        )
+
+    def test_duplicate_field_entry_is_kept(self):
+        text = "@article{d1,\n  title = {a},\n  title = {b},\n  year = {2003}\n}\n"
+        entries = clean._parse_entries(text)
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["ID"], "d1")
+        self.assertEqual(entries[0]["title"], "b")
+        self.assertEqual(entries[0]["year"], "2003")
+
+    def test_recovered_entry_resolves_string_references(self):
+        text = (
+            "@string{jn = {Nature Chemistry}}\n\n"
+            "@article{s1,\n  journal = jn,\n  title = {One}\n}\n\n"
+            "@article{s1,\n  journal = jn,\n  title = {Two}\n}\n"
+        )
+        entries = clean._parse_entries(text)
+        self.assertEqual(
+            [e["journal"] for e in entries], ["Nature Chemistry", "Nature Chemistry"]
+        )
+
+    def test_malformed_block_is_skipped(self):
+        text = (
+            "@article{bad,\n  title = {broken,\n  year = 2001\n\n"
+            "@article{good,\n  title = {Fine},\n  year = {2004}\n}\n"
+        )
+        with self.assertLogs("clean", level="WARNING"):
+            entries = clean._parse_entries(text)
+        self.assertIn("good", [e["ID"] for e in entries])
+
+    def test_duplicates_survive_clean_bibtex_text(self):
+        text = (
+            "@article{k1,\n  title = {First},\n  year = {2001}\n}\n\n"
+            "@article{k1,\n  title = {Second},\n  year = {2002}\n}\n"
+        )
+        output = clean.clean_bibtex_text(text)
+        self.assertEqual(output.count("@article{k1,"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
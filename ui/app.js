@@ -68,6 +68,7 @@ function renderKeepFields() {
 renderKeepFields();
 
 let debounceTimer = null;
+let cleanRun = 0;
 
 function setStatus(message, isError = false) {
   outputStatus.textContent = message;
@@ -108,6 +109,8 @@ async function runClean() {
     journal_abbrev: parseJournalAbbrev(),
   };
 
+  const run = ++cleanRun;
+
   if (!payload.input.trim()) {
     outputBib.value = "";
     setStatus("Ready");
@@ -123,14 +126,33 @@ async function runClean() {
       body: JSON.stringify(payload),
     });
 
-    const data = await res.json();
+    // A newer run has started; leave the output to it.
+    if (run !== cleanRun) return;
+
     if (!res.ok) {
+      const data = await res.json();
       throw new Error(data.error || "Failed to clean bibliography.");
     }
 
-    outputBib.value = data.output || "";
+    // The cleaned entries arrive as streamed plain text. Collect the chunks
+    // and render once; appending to the textarea per chunk is quadratic.
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    const chunks = [];
+    while (true) {
+      const { done, value } = await reader.read();
+      if (run !== cleanRun) {
+        reader.cancel();
+        return;
+      }
+      if (done) break;
+      chunks.push(decoder.decode(value, { stream: true }));
+    }
+    chunks.push(decoder.decode());
+    outputBib.value = chunks.join("");
     setStatus("Cleaned");
   } catch (err) {
+    if (run !== cleanRun) return;
     outputBib.value = "";
     setStatus(err.message, true);
   }
@@ -2,11 +2,16 @@
 
 import json
 
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.views.decorators.csrf import csrf_exempt
 
-from clean import clean_bibtex_text
+try:
+    import orjson
+except ImportError:  # optional, faster decoding of multi-MB payloads
+    orjson = None
+
+from clean import clean_bibtex_text_iter
 
 
 def index(request):
@@ -19,14 +24,17 @@ def clean_api(request):
         return JsonResponse({"error": "Method not allowed"}, status=405)
 
     try:
-        payload = json.loads(request.body.decode("utf-8") or "{}")
+        body = request.body or b"{}"
+        payload = orjson.loads(body) if orjson else json.loads(body)
         input_text = payload.get("input", "")
         do_titlecase = bool(payload.get("titlecase", True))
         protect_titlecase = bool(payload.get("protectTitlecase", False))
         regen_keys = bool(payload.get("regen_keys", False))
         journal_abbrev = payload.get("journal_abbrev") or None
 
-        output_text = clean_bibtex_text(
+        # Cleaning errors surface here as a 400; the response body then
+        # streams the formatted entries as plain text.
+        chunks = clean_bibtex_text_iter(
             input_text,
             do_titlecase=do_titlecase,
             protect_titlecase=protect_titlecase,
@@ -34,6 +42,8 @@ def clean_api(request):
             journal_abbrev=journal_abbrev,
         )
 
-        return JsonResponse({"output": output_text})
+        return StreamingHttpResponse(
+            chunks, content_type="text/plain; charset=utf-8"
+        )
     except Exception as exc:
         return JsonResponse({"error": str(exc)}, status=400)